@@ -0,0 +1,51 @@
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from http_utils import json_dumps, json_loads
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "litellm-scripts"
+)
+
+
+def cache_key(*parts):
+    """Build a filesystem-safe cache name from parts that may contain secrets."""
+    digest = hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+    return digest[:32]
+
+
+def read_cache(name, max_age=None):
+    """Return the cached JSON value for name, or None if missing or stale.
+
+    max_age is in seconds; None means the entry never expires.
+    """
+    path = CACHE_DIR / f"{name}.json"
+    try:
+        if max_age is not None and time.time() - path.stat().st_mtime > max_age:
+            return None
+        return json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def write_cache(name, value):
+    """Atomically store value as JSON under name. Failures are only logged."""
+    path = CACHE_DIR / f"{name}.json"
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.unlink(missing_ok=True)
+        # Entries may hold API keys (e.g. generated configs), so the file is
+        # private from the moment it is created
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps(value))
+        tmp_path.replace(path)
+    except OSError as e:
+        logger.warning(f"Failed to write cache {path}: {e}")
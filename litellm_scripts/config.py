@@ -19,16 +19,24 @@ Usage:
 """
 
 import asyncio
-import urllib.request
+import atexit
+import hashlib
+import inspect
 import urllib.error
-import json
 import os
 import logging
 import argparse
+from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
-from http_utils import build_request, format_http_error, request_json
+from http_utils import (
+    close_keepalive_connections,
+    format_http_error,
+    json_dumps,
+    json_loads,
+    keepalive_request,
+)
 from load_dotenv import load_dotenv
 
 from gen_config import (
@@ -50,6 +58,20 @@ LITELLM_API_KEY = os.environ["LITELLM_API_KEY"]
 LITELLM_BASE_URL = os.environ["LITELLM_BASE_URL"]
 
 DEFAULT_CONFIG_FILE = "config.json"
+# Hashes of the aliases/fallbacks last applied to each LiteLLM instance
+SYNC_STATE_FILE = Path(".litellm-sync-state.json")
+
+# Shared pool for blocking HTTP calls; each worker thread keeps its own
+# keep-alive connection, so this also bounds open connections to LiteLLM
+HTTP_MAX_WORKERS = 16
+# Retries for idempotent GETs that fail at the connection level
+GET_RETRIES = 3
+# Maximum models being created/replaced at once during a model sync
+MODEL_SYNC_CONCURRENCY = 10
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=HTTP_MAX_WORKERS, thread_name_prefix="litellm-http"
+)
+atexit.register(_EXECUTOR.shutdown, wait=True)
 
 
 # ============================================================================
@@ -61,7 +83,9 @@ def get_actor_from_key():
     url = f"{LITELLM_BASE_URL}/key/info"
     headers = {"Authorization": "Bearer " + LITELLM_API_KEY}
     try:
-        data = request_json(url, headers=headers)
+        data = json_loads(
+            keepalive_request(url, headers=headers, retries=GET_RETRIES)
+        )
         return (
             data.get("info", {}).get("user_id")
             or data.get("info", {}).get("team_id")
@@ -84,7 +108,9 @@ def get_request(endpoint):
     url = f"{LITELLM_BASE_URL}/{endpoint}"
     headers = {"Authorization": "Bearer " + LITELLM_API_KEY}
     try:
-        return True, request_json(url, headers=headers)
+        return True, json_loads(
+            keepalive_request(url, headers=headers, retries=GET_RETRIES)
+        )
     except urllib.error.HTTPError as e:
         return False, format_http_error(e)
     except Exception as e:
@@ -97,10 +123,11 @@ def post_request(endpoint, data):
         "Authorization": "Bearer " + LITELLM_API_KEY,
         "Content-Type": "application/json",
     }
-    req = build_request(url, data=json.dumps(data).encode(), headers=headers)
     try:
-        with urllib.request.urlopen(req) as res:
-            return True, res.read().decode()
+        body = keepalive_request(
+            url, data=json_dumps(data), headers=headers, method="POST"
+        )
+        return True, body.decode()
     except urllib.error.HTTPError as e:
         return False, format_http_error(e)
     except Exception as e:
@@ -110,16 +137,24 @@ def post_request(endpoint, data):
 def delete_request(endpoint):
     url = f"{LITELLM_BASE_URL}/{endpoint}"
     headers = {"Authorization": "Bearer " + LITELLM_API_KEY}
-    req = build_request(url, headers=headers, method="DELETE")
     try:
-        with urllib.request.urlopen(req) as res:
-            return True, res.read().decode()
+        return True, keepalive_request(url, headers=headers, method="DELETE").decode()
     except urllib.error.HTTPError as e:
         return False, format_http_error(e)
     except Exception as e:
         return False, str(e)
 
 
+async def run_http(func, *args):
+    """Run a blocking request helper on the shared HTTP pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, func, *args)
+
+
+async def apost_request(endpoint, data):
+    return await run_http(post_request, endpoint, data)
+
+
 # ============================================================================
 # Credential Management
 # ============================================================================
@@ -140,22 +175,30 @@ def get_all_credentials():
     ]
 
 
+_credential_names_cache = None
+
+
+def _get_credential_names():
+    """Return the set of existing credential names, fetching it only once.
+
+    Kept in sync by create_credential and delete_credential instead of being
+    re-fetched from /credentials.
+    """
+    global _credential_names_cache
+    if _credential_names_cache is None:
+        _credential_names_cache = set(get_all_credentials())
+    return _credential_names_cache
+
+
 def credential_exists(credential_name):
-    success, result = get_request("credentials")
-    if not success:
-        return False
-    # Handle both dict with "credentials" key and list response formats
-    creds = result.get("credentials", result) if isinstance(result, dict) else result
-    if not isinstance(creds, list):
-        return False
-    for cred in creds:
-        if isinstance(cred, dict) and cred.get("credential_name") == credential_name:
-            return True
-    return False
+    return credential_name in _get_credential_names()
 
 
 def delete_credential(credential_name):
-    return delete_request(f"credentials/{credential_name}")
+    success, result = delete_request(f"credentials/{credential_name}")
+    if success:
+        _get_credential_names().discard(credential_name)
+    return success, result
 
 
 def patch_request(endpoint, data):
@@ -164,15 +207,11 @@ def patch_request(endpoint, data):
         "Authorization": "Bearer " + LITELLM_API_KEY,
         "Content-Type": "application/json",
     }
-    req = build_request(
-        url,
-        data=json.dumps(data).encode(),
-        headers=headers,
-        method="PATCH",
-    )
     try:
-        with urllib.request.urlopen(req) as res:
-            return True, res.read().decode()
+        body = keepalive_request(
+            url, data=json_dumps(data), headers=headers, method="PATCH"
+        )
+        return True, body.decode()
     except urllib.error.HTTPError as e:
         return False, format_http_error(e)
     except Exception as e:
@@ -194,19 +233,15 @@ def create_credential(request_body, force=False):
         return True, "skipped", "skipped"
 
     success, result = post_request("credentials", request_body)
+    if success:
+        _get_credential_names().add(credential_name)
     return success, result, "created"
 
 
-async def create_credential_async(executor, request_body, force=False):
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(
-        executor, create_credential, request_body, force
-    )
+async def create_credential_async(request_body, force=False):
+    """Create or update a credential. Returns (success, action)."""
+    success, msg, action = await run_http(create_credential, request_body, force)
     credential_name = request_body["credential_name"]
-    if len(result) == 2:
-        success, msg = result
-        return success, msg
-    success, msg, action = result
     if success:
         if action == "updated":
             logger.info(f"Updated credential: {credential_name}")
@@ -214,7 +249,17 @@ async def create_credential_async(executor, request_body, force=False):
             logger.info(f"Created credential: {credential_name}")
     else:
         logger.error(f"Failed to sync credential: {credential_name} - {msg}")
-    return success, msg
+    return success, action
+
+
+async def delete_credential_async(credential_name):
+    logger.info(f"Pruning credential: {credential_name}")
+    success, result = await run_http(delete_credential, credential_name)
+    if success:
+        logger.info(f"Deleted credential: {credential_name}")
+    else:
+        logger.error(f"Failed to delete credential: {credential_name} - {result}")
+    return success, result
 
 
 # ============================================================================
@@ -230,65 +275,107 @@ def get_all_models():
     return result.get("data", [])
 
 
+def get_models_by_key():
+    """Get all models grouped by (model_name, credential_name).
+
+    Each key maps to the list of raw model objects, so duplicates of the
+    same model/credential pair end up together.
+    """
+    models_by_key = defaultdict(list)
+    for model in get_all_models():
+        try:
+            key = (
+                model["model_name"],
+                model["litellm_params"]["litellm_credential_name"],
+            )
+        except (KeyError, TypeError):
+            # Not managed by this script (e.g. defined in the proxy's config file)
+            continue
+        models_by_key[key].append(model)
+    return models_by_key
+
+
 def delete_model_by_id(model_id):
     """Delete a model by its ID directly."""
     return post_request("model/delete", {"id": model_id})
 
 
-def _create_model(payload, force, actor, existing_models_cache):
+# model_info key holding config_hash(payload) of the config a model was
+# created from; LiteLLM adds its own cost-map fields to model_info, so the
+# stored hash is what tells whether the config changed since
+MODEL_CONFIG_HASH_KEY = "config_hash"
+
+
+def _model_matches_payload(model, payload_hash):
+    """Check whether an existing model was created from the same config."""
+    model_info = model.get("model_info") or {}
+    return model_info.get(MODEL_CONFIG_HASH_KEY) == payload_hash
+
+
+async def _acreate_model(
+    payload, force, audit_fields, existing_models_cache, force_touch=False
+):
     """Create or replace a single model from a pre-built payload.
 
     Args:
         payload: Dict with model_name, litellm_params, model_info (from gen_config)
         force: Whether to replace existing models
-        actor: Actor identifier for audit fields
+        audit_fields: created_*/updated_* model_info fields for this sync run
         existing_models_cache: Dict of (model_name, credential_name) -> [raw model objects]
+        force_touch: Replace existing models even if they already match the payload
 
     Returns:
-        (success, action, duplicates_deleted)
+        (success, action, duplicates_deleted); action is "created", "replaced",
+        "unchanged" or "skipped"
     """
     full_model_name = payload["model_name"]
     credential_name = payload["litellm_params"]["litellm_credential_name"]
 
     # Check if model exists using cached models (could have multiple duplicates)
     model_key = (full_model_name, credential_name)
+    payload_hash = config_hash(payload)
     existing_models = existing_models_cache.get(model_key, [])
     duplicates_deleted = 0
 
     if existing_models:
+        if (
+            force
+            and not force_touch
+            and len(existing_models) == 1
+            and _model_matches_payload(existing_models[0], payload_hash)
+        ):
+            logger.debug("Unchanged model: %s (%s)", full_model_name, credential_name)
+            return True, "unchanged", 0
         if force:
-            for model in existing_models:
-                delete_model_by_id(model["model_info"]["id"])
+            await asyncio.gather(
+                *(
+                    run_http(delete_model_by_id, model["model_info"]["id"])
+                    for model in existing_models
+                )
+            )
             duplicates_deleted = len(existing_models) - 1
             action = "replaced"
         else:
-            logger.info(f"Skipped model: {full_model_name} ({credential_name})")
-            return True, None, 0
+            logger.debug("Skipped model: %s (%s)", full_model_name, credential_name)
+            return True, "skipped", 0
     else:
         action = "created"
 
-    now_iso_string = (
-        datetime.now(timezone.utc)
-        .isoformat(timespec="milliseconds")
-        .replace("+00:00", "Z")
-    )
-
-    # Add audit fields to model_info
-    model_info = dict(payload.get("model_info", {}))
+    # Add audit fields to model_info, keeping the original creation fields
+    preserved_fields = {}
     if existing_models:
         existing_model_info = existing_models[0]["model_info"]
-        if existing_model_info.get("created_at"):
-            model_info["created_at"] = existing_model_info["created_at"]
-        if existing_model_info.get("created_by"):
-            model_info["created_by"] = existing_model_info["created_by"]
-    model_info.update(
-        {
-            "updated_at": now_iso_string,
-            "updated_by": actor,
-        }
-    )
-    model_info.setdefault("created_at", now_iso_string)
-    model_info.setdefault("created_by", actor)
+        for field in ("created_at", "created_by"):
+            if existing_model_info.get(field):
+                preserved_fields[field] = existing_model_info[field]
+    model_info = {
+        **audit_fields,
+        **payload.get("model_info", {}),
+        **preserved_fields,
+        "updated_at": audit_fields["updated_at"],
+        "updated_by": audit_fields["updated_by"],
+        MODEL_CONFIG_HASH_KEY: payload_hash,
+    }
 
     request_body = {
         "model_name": full_model_name,
@@ -296,28 +383,37 @@ def _create_model(payload, force, actor, existing_models_cache):
         "model_info": model_info,
     }
 
-    success, result = post_request("model/new", request_body)
+    success, result = await apost_request("model/new", request_body)
 
+    # Per-model success logs are DEBUG (lazily formatted); the sync_models
+    # summary reports the totals at INFO
     if success:
-        if action == "replaced":
-            logger.info(f"Replaced model: {full_model_name} ({credential_name})")
-        else:
-            logger.info(f"Created model: {full_model_name} ({credential_name})")
+        logger.debug(
+            "%s model: %s (%s)", action.capitalize(), full_model_name, credential_name
+        )
     else:
         logger.error(
-            f"Failed to create model: {full_model_name} ({credential_name}) - {result}"
+            "Failed to create model: %s (%s) - %s",
+            full_model_name,
+            credential_name,
+            result,
         )
 
     return success, action, duplicates_deleted
 
 
-async def _sync_single_model(executor, payload, force, actor, existing_models_cache):
-    """Async wrapper for _create_model."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        executor,
-        lambda: _create_model(payload, force, actor, existing_models_cache),
-    )
+async def _prune_model(model):
+    """Delete a model that is no longer in the config. Returns success."""
+    model_name = model["model_name"]
+    credential_name = model["litellm_params"]["litellm_credential_name"]
+    success, result = await run_http(delete_model_by_id, model["model_info"]["id"])
+    if success:
+        logger.info("Deleted model: %s (%s)", model_name, credential_name)
+    else:
+        logger.error(
+            "Failed to delete model: %s (%s) - %s", model_name, credential_name, result
+        )
+    return success
 
 
 # ============================================================================
@@ -325,19 +421,28 @@ async def _sync_single_model(executor, payload, force, actor, existing_models_ca
 # ============================================================================
 
 
-def get_router_settings():
-    """Get current router settings from /router/settings endpoint."""
-    success, result = get_request("router/settings")
-    if not success:
-        return {}
-    return result.get("current_values", {})
+# Parsed /router/settings values, kept in step with our own config/update calls
+_router_settings_cache = None
+
+
+def get_router_settings(force_refresh=False):
+    """Get current router settings from /router/settings endpoint (memoized)."""
+    global _router_settings_cache
+    if _router_settings_cache is None or force_refresh:
+        success, result = get_request("router/settings")
+        if not success:
+            return {}
+        _router_settings_cache = result.get("current_values", {})
+    return _router_settings_cache
 
 
 def update_router_settings(updates: dict):
     """
     Update router settings while preserving existing values.
-    Fetches current settings, merges with updates, and posts to config/update.
+    Merges updates into the (memoized) current settings and posts to
+    config/update; on success the memo is replaced with the merged settings.
     """
+    global _router_settings_cache
     current = get_router_settings()
 
     # Start with current settings, then apply updates
@@ -345,7 +450,77 @@ def update_router_settings(updates: dict):
     router_settings.update(updates)
 
     payload = {"router_settings": router_settings}
-    return post_request("config/update", payload)
+    success, result = post_request("config/update", payload)
+    if success:
+        _router_settings_cache = router_settings
+    return success, result
+
+
+# ============================================================================
+# Validation Cache
+# ============================================================================
+
+# Server-side model names and aliases used only for post-update validation
+# warnings; memoized so each sync run fetches them at most once.
+_validation_cache = {}
+
+
+def get_validation_model_names():
+    if "models" not in _validation_cache:
+        _validation_cache["models"] = {m["model_name"] for m in get_all_models()}
+    return _validation_cache["models"]
+
+
+def get_validation_aliases():
+    if "aliases" not in _validation_cache:
+        _validation_cache["aliases"] = get_current_aliases()
+    return _validation_cache["aliases"]
+
+
+def invalidate_validation_cache():
+    _validation_cache.clear()
+
+
+# Validation warnings for updated components, deferred until every component
+# has synced so they check against the final server state
+_pending_validations = []
+
+
+def run_pending_validations():
+    while _pending_validations:
+        _pending_validations.pop(0)()
+
+
+# ============================================================================
+# Sync State
+# ============================================================================
+
+
+def config_hash(value):
+    """Stable hash of a JSON-serializable config section."""
+    data = json_dumps(value, sort_keys=True)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _read_sync_state():
+    try:
+        return json_loads(SYNC_STATE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def get_applied_hash(component):
+    """Return the hash of the component last applied to LITELLM_BASE_URL."""
+    return _read_sync_state().get(LITELLM_BASE_URL, {}).get(component)
+
+
+def record_applied_hash(component, value_hash):
+    state = _read_sync_state()
+    state.setdefault(LITELLM_BASE_URL, {})[component] = value_hash
+    try:
+        SYNC_STATE_FILE.write_bytes(json_dumps(state))
+    except OSError as e:
+        logger.warning(f"Failed to write sync state {SYNC_STATE_FILE}: {e}")
 
 
 # ============================================================================
@@ -363,19 +538,29 @@ def update_aliases(aliases: dict, force=False):
         logger.info("No aliases to update")
         return True, "no aliases"
 
+    aliases_hash = config_hash(aliases)
+    if not force and get_applied_hash("aliases") == aliases_hash:
+        logger.info("Aliases unchanged since last sync, skipping")
+        return True, "skipped"
+
     current_aliases = get_current_aliases()
 
     if not force and current_aliases == aliases:
         logger.info("Aliases already up-to-date, skipping")
+        record_applied_hash("aliases", aliases_hash)
         return True, "skipped"
 
     success, result = update_router_settings({"model_group_alias": aliases})
 
     if success:
         logger.info(f"✅ Updated {len(aliases)} model group aliases")
+        record_applied_hash("aliases", aliases_hash)
+        # The server now holds exactly these aliases
+        _validation_cache["aliases"] = aliases
         # Validate aliases point to existing models or other aliases
-        existing_models = {model["model_name"] for model in get_all_models()}
-        validate_aliases(aliases, existing_models)
+        _pending_validations.append(
+            lambda: validate_aliases(aliases, get_validation_model_names())
+        )
     else:
         logger.error(f"❌ Failed to update aliases: {result}")
 
@@ -397,20 +582,29 @@ def update_fallbacks(fallbacks: list, force=False):
         logger.info("No fallbacks to update")
         return True, "no fallbacks"
 
+    fallbacks_hash = config_hash(fallbacks)
+    if not force and get_applied_hash("fallbacks") == fallbacks_hash:
+        logger.info("Fallbacks unchanged since last sync, skipping")
+        return True, "skipped"
+
     current_fallbacks = get_current_fallbacks()
 
     if not force and current_fallbacks == fallbacks:
         logger.info("Fallbacks already up-to-date, skipping")
+        record_applied_hash("fallbacks", fallbacks_hash)
         return True, "skipped"
 
     success, result = update_router_settings({"fallbacks": fallbacks})
 
     if success:
         logger.info(f"✅ Updated {len(fallbacks)} fallback rules")
+        record_applied_hash("fallbacks", fallbacks_hash)
         # Validate fallbacks reference existing models or aliases
-        existing_models = {model["model_name"] for model in get_all_models()}
-        current_aliases = get_current_aliases()
-        validate_fallbacks(fallbacks, existing_models, current_aliases)
+        _pending_validations.append(
+            lambda: validate_fallbacks(
+                fallbacks, get_validation_model_names(), get_validation_aliases()
+            )
+        )
     else:
         logger.error(f"❌ Failed to update fallbacks: {result}")
 
@@ -423,13 +617,8 @@ def update_fallbacks(fallbacks: list, force=False):
 
 
 def _normalize_public_model_hub(model_groups: list) -> list:
-    normalized = []
-    seen = set()
-    for model_group in model_groups:
-        if model_group not in seen:
-            normalized.append(model_group)
-            seen.add(model_group)
-    return normalized
+    # Drop duplicates while keeping first-seen order
+    return list(dict.fromkeys(model_groups))
 
 
 def get_current_public_model_hub():
@@ -460,10 +649,12 @@ def update_public_model_hub(model_groups: list, force=False):
         logger.info(
             f"✅ Updated public model hub with {len(desired_model_groups)} entries"
         )
-        existing_models = {model["model_name"] for model in get_all_models()}
-        current_aliases = get_current_aliases()
-        validate_public_model_hub(
-            desired_model_groups, existing_models, current_aliases
+        _pending_validations.append(
+            lambda: validate_public_model_hub(
+                desired_model_groups,
+                get_validation_model_names(),
+                get_validation_aliases(),
+            )
         )
     else:
         logger.error(f"❌ Failed to update public model hub: {result}")
@@ -484,37 +675,72 @@ async def sync_credentials(config: dict, force=False, prune=False):
     expected_credentials = set()
     credentials = config.get("credentials", [])
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        tasks = []
+    # Fetch the existing credential names once, before the concurrent creates
+    _get_credential_names()
+
+    tasks = []
 
-        for cred in credentials:
-            if not (
-                isinstance(cred, dict)
-                and cred.get("credential_name")
-                and isinstance(cred.get("credential_values"), dict)
-            ):
-                logger.warning(f"Invalid credential config, skipping: {cred}")
-                continue
+    for cred in credentials:
+        if not (
+            isinstance(cred, dict)
+            and cred.get("credential_name")
+            and isinstance(cred.get("credential_values"), dict)
+        ):
+            logger.warning(f"Invalid credential config, skipping: {cred}")
+            continue
 
-            expected_credentials.add(cred["credential_name"])
-            tasks.append(create_credential_async(executor, cred, force))
+        expected_credentials.add(cred["credential_name"])
+        tasks.append(create_credential_async(cred, force))
 
-        await asyncio.gather(*tasks)
+    # All creates are scheduled before any result is collected
+    results = await asyncio.gather(*tasks)
+
+    created_count = 0
+    updated_count = 0
+    deleted_count = 0
+    failed_count = 0
+    for success, action in results:
+        if not success:
+            failed_count += 1
+        elif action == "created":
+            created_count += 1
+        elif action == "updated":
+            updated_count += 1
 
     if prune:
         logger.info("Pruning unused credentials...")
-        existing_credentials = get_all_credentials()
-        for cred_name in existing_credentials:
-            if cred_name not in expected_credentials:
-                logger.info(f"Pruning credential: {cred_name}")
-                success, result = delete_credential(cred_name)
-                if success:
-                    logger.info(f"Deleted credential: {cred_name}")
-                else:
-                    logger.error(f"Failed to delete credential: {cred_name} - {result}")
-
-
-async def sync_models(config: dict, force=False, prune=False):
+        prune_results = await asyncio.gather(
+            *[
+                delete_credential_async(cred_name)
+                for cred_name in sorted(_get_credential_names() - expected_credentials)
+            ]
+        )
+        for success, _ in prune_results:
+            if success:
+                deleted_count += 1
+            else:
+                failed_count += 1
+
+    total_ops = created_count + updated_count + deleted_count + failed_count
+    if failed_count == 0:
+        icon = "✅"
+    elif failed_count == total_ops:
+        icon = "❌"
+    else:
+        icon = "⚠️"
+    logger.info(
+        f"{icon} Credentials: Created {created_count}, Updated {updated_count}, Deleted {deleted_count}, Failed {failed_count}"
+    )
+
+
+async def sync_models(
+    config: dict, force=False, prune=False, force_touch=False, alongside_prune=None
+):
+    """Create/replace configured models, then prune stale ones if requested.
+
+    alongside_prune is an optional awaitable that runs once every model has
+    been written, concurrently with pruning.
+    """
     logger.info("=" * 60)
     logger.info("Syncing models...")
     logger.info("=" * 60)
@@ -522,25 +748,34 @@ async def sync_models(config: dict, force=False, prune=False):
     actor = get_actor_from_key()
     logger.info(f"Actor: {actor}")
 
-    expected_models = set()
+    # One set of audit fields for every model written by this sync run
+    sync_timestamp = (
+        datetime.now(timezone.utc)
+        .isoformat(timespec="milliseconds")
+        .replace("+00:00", "Z")
+    )
+    audit_fields = {
+        "created_at": sync_timestamp,
+        "created_by": actor,
+        "updated_at": sync_timestamp,
+        "updated_by": actor,
+    }
+
     model_payloads = config.get("models", [])
+    expected_models = {
+        (payload["model_name"], payload["litellm_params"]["litellm_credential_name"])
+        for payload in model_payloads
+    }
 
     created_count = 0
     replaced_count = 0
+    unchanged_count = 0
+    skipped_count = 0
     deleted_count = 0
     failed_count = 0
 
     # Cache existing models once before processing (store matching raw model objects)
-    existing_models_cache = {}
-    all_models = get_all_models()
-    for model in all_models:
-        key = (
-            model["model_name"],
-            model["litellm_params"]["litellm_credential_name"],
-        )
-        if key not in existing_models_cache:
-            existing_models_cache[key] = []
-        existing_models_cache[key].append(model)
+    existing_models_cache = get_models_by_key()
 
     # Count total unique model groups and warn about duplicates
     total_models = sum(len(ids) for ids in existing_models_cache.values())
@@ -553,48 +788,56 @@ async def sync_models(config: dict, force=False, prune=False):
         f"Found {total_models} existing models ({len(existing_models_cache)} unique)"
     )
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        tasks = []
-
-        for payload in model_payloads:
-            full_model_name = payload["model_name"]
-            credential_name = payload["litellm_params"]["litellm_credential_name"]
-            expected_models.add((full_model_name, credential_name))
+    semaphore = asyncio.Semaphore(MODEL_SYNC_CONCURRENCY)
 
-            tasks.append(
-                _sync_single_model(
-                    executor, payload, force, actor, existing_models_cache
-                )
+    async def sync_model(payload):
+        async with semaphore:
+            return await _acreate_model(
+                payload,
+                force,
+                audit_fields,
+                existing_models_cache,
+                force_touch,
             )
 
-        results = await asyncio.gather(*tasks)
-        for success, action, duplicates_deleted in results:
-            if success and action == "created":
-                created_count += 1
-            elif success and action == "replaced":
-                replaced_count += 1
-                deleted_count += duplicates_deleted
-            elif not success:
-                failed_count += 1
-
+    results = await asyncio.gather(*[sync_model(payload) for payload in model_payloads])
+    for success, action, duplicates_deleted in results:
+        if success and action == "created":
+            created_count += 1
+        elif success and action == "replaced":
+            replaced_count += 1
+            deleted_count += duplicates_deleted
+        elif success and action == "unchanged":
+            unchanged_count += 1
+        elif success and action == "skipped":
+            skipped_count += 1
+        elif not success:
+            failed_count += 1
+
+    stale_models = []
     if prune:
         logger.info("Pruning unused models...")
-        existing_models = get_all_models()
-        for model in existing_models:
-            model_name = model["model_name"]
-            credential_name = model["litellm_params"]["litellm_credential_name"]
-            model_id = model["model_info"]["id"]
-            if (model_name, credential_name) not in expected_models:
-                logger.info(f"Pruning model: {model_name} ({credential_name})")
-                success, result = post_request("model/delete", {"id": model_id})
-                if success:
-                    logger.info(f"Deleted model: {model_name} ({credential_name})")
-                    deleted_count += 1
-                else:
-                    logger.error(
-                        f"Failed to delete model: {model_name} ({credential_name}) - {result}"
-                    )
-                    failed_count += 1
+        # Models created or replaced above are all expected, so the models
+        # fetched before the sync are enough to find the stale ones
+        stale_models = [
+            model
+            for key, models in existing_models_cache.items()
+            if key not in expected_models
+            for model in models
+        ]
+    prune_future = asyncio.gather(*[_prune_model(model) for model in stale_models])
+    if alongside_prune is not None:
+        prune_results, _ = await asyncio.gather(prune_future, alongside_prune)
+    else:
+        prune_results = await prune_future
+    for success in prune_results:
+        if success:
+            deleted_count += 1
+        else:
+            failed_count += 1
+
+    # Models changed on the server; later validation must re-fetch them
+    invalidate_validation_cache()
 
     total_ops = created_count + replaced_count + deleted_count + failed_count
     if failed_count == 0:
@@ -604,7 +847,7 @@ async def sync_models(config: dict, force=False, prune=False):
     else:
         icon = "⚠️"
     logger.info(
-        f"{icon} Models: Created {created_count}, Replaced {replaced_count}, Deleted {deleted_count}, Failed {failed_count}"
+        f"{icon} Models: Created {created_count}, Replaced {replaced_count}, Unchanged {unchanged_count}, Skipped {skipped_count}, Deleted {deleted_count}, Failed {failed_count}"
     )
 
 
@@ -626,6 +869,17 @@ def sync_fallbacks(config: dict, force=False):
     update_fallbacks(fallbacks, force)
 
 
+async def sync_router_settings(config: dict, components, force=False):
+    """Sync aliases, then fallbacks.
+
+    Both read-modify-write router_settings, so they never run concurrently.
+    """
+    if "aliases" in components:
+        await run_http(sync_aliases, config, force)
+    if "fallbacks" in components:
+        await run_http(sync_fallbacks, config, force)
+
+
 def sync_public_model_hub(config: dict, force=False):
     logger.info("=" * 60)
     logger.info("Syncing public model hub...")
@@ -653,6 +907,11 @@ async def main():
         action="store_true",
         help="Force update existing resources",
     )
+    parser.add_argument(
+        "--force-touch",
+        action="store_true",
+        help="Like --force, but also replace models that already match the config",
+    )
     parser.add_argument(
         "--prune",
         action="store_true",
@@ -669,8 +928,15 @@ async def main():
         default=DEFAULT_CONFIG_FILE,
         help="Path to the config file (default: config.json in script dir)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate the config even if a recent cached result matches",
+    )
 
     args = parser.parse_args()
+    if args.force_touch:
+        args.force = True
 
     components = [c.strip() for c in args.only.split(",")]
     valid_components = {
@@ -700,22 +966,45 @@ async def main():
         logger.error(f"Config file not found: {config_file}")
         return
 
-    config = generate_config(config_file)
-
-    if "credentials" in components:
-        await sync_credentials(config, args.force, args.prune)
-
-    if "models" in components:
-        await sync_models(config, args.force, args.prune)
-
-    if "aliases" in components:
-        sync_aliases(config, args.force)
+    config = generate_config(config_file, use_cache=not args.no_cache)
+    invalidate_validation_cache()
 
-    if "fallbacks" in components:
-        sync_fallbacks(config, args.force)
-
-    if "public_model_hub" in components:
-        sync_public_model_hub(config, args.force)
+    router_sync = None
+    try:
+        if "credentials" in components:
+            await sync_credentials(config, args.force, args.prune)
+
+        # Router settings are fetched lazily (and once), so aliases and
+        # fallbacks unchanged since the last sync cost no requests at all.
+        # Updating them doesn't need the models to exist, so it overlaps
+        # with model pruning.
+        if "aliases" in components or "fallbacks" in components:
+            router_sync = sync_router_settings(config, components, args.force)
+
+        if "models" in components:
+            await sync_models(
+                config,
+                args.force,
+                args.prune,
+                args.force_touch,
+                alongside_prune=router_sync,
+            )
+        elif router_sync is not None:
+            await router_sync
+
+        if "public_model_hub" in components:
+            sync_public_model_hub(config, args.force)
+
+        run_pending_validations()
+    finally:
+        # sync_models failed before starting the router sync; close the
+        # coroutine so it isn't left un-awaited
+        if (
+            router_sync is not None
+            and inspect.getcoroutinestate(router_sync) == inspect.CORO_CREATED
+        ):
+            router_sync.close()
+        close_keepalive_connections()
 
     logger.info("=" * 60)
     logger.info("✅ Sync complete!")
@@ -2,10 +2,11 @@
 import argparse
 import urllib.parse
 import urllib.error
-import json
 import os
 import sys
-from http_utils import format_http_error, request_json
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http_utils import format_http_error, json_dumps, request_json
 from load_dotenv import load_dotenv
 
 
@@ -15,11 +16,15 @@ load_dotenv()
 LITELLM_API_KEY = os.environ["LITELLM_API_KEY"]
 LITELLM_BASE_URL = os.environ["LITELLM_BASE_URL"]
 
+# Maximum users provisioned concurrently in --emails-file mode
+BATCH_MAX_WORKERS = 8
+
 
 def get_user_by_email(email):
     """Get user by email. Returns user data or None if not found."""
     # user_email is a partial match filter, so we need to check exact match
-    url = f"{LITELLM_BASE_URL}/user/list?user_email={urllib.parse.quote(email)}&page=1&page_size=100"
+    query = urllib.parse.urlencode({"user_email": email, "page": 1, "page_size": 100})
+    url = f"{LITELLM_BASE_URL}/user/list?{query}"
     try:
         data = request_json(
             url,
@@ -45,7 +50,7 @@ def get_user_by_email(email):
 
 
 def create_user(email):
-    """Create a new user with the given email."""
+    """Create a new user with the given email. Returns None on failure."""
     payload = {
         "user_id": None,
         "user_email": email,
@@ -54,7 +59,7 @@ def create_user(email):
         "auto_create_key": False,
     }
 
-    data = json.dumps(payload).encode("utf-8")
+    data = json_dumps(payload)
 
     try:
         return request_json(
@@ -68,12 +73,15 @@ def create_user(email):
             },
         )
     except urllib.error.HTTPError as e:
-        print(f"❌ Failed to create user: {format_http_error(e)}", file=sys.stderr)
-        sys.exit(1)
+        print(
+            f"❌ Failed to create user {email}: {format_http_error(e)}",
+            file=sys.stderr,
+        )
+        return None
 
 
 def create_api_key(user_id, key_alias, key_value=None):
-    """Create an API key for the given user."""
+    """Create an API key for the given user. Returns None on failure."""
     payload = {
         "user_id": user_id,
         "team_id": None,
@@ -86,7 +94,7 @@ def create_api_key(user_id, key_alias, key_value=None):
     if key_value:
         payload["key"] = key_value
 
-    data = json.dumps(payload).encode("utf-8")
+    data = json_dumps(payload)
 
     try:
         return request_json(
@@ -100,20 +108,19 @@ def create_api_key(user_id, key_alias, key_value=None):
             },
         )
     except urllib.error.HTTPError as e:
-        print(f"❌ Failed to create API key: {format_http_error(e)}", file=sys.stderr)
-        sys.exit(1)
+        print(
+            f"❌ Failed to create API key {key_alias}: {format_http_error(e)}",
+            file=sys.stderr,
+        )
+        return None
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Create LiteLLM user and API key")
-    parser.add_argument("email", help="User email address")
-    parser.add_argument("--alias", "-a", help="API key alias (default: email prefix)")
-    parser.add_argument("--key", "-k", help="Custom API key value (optional)")
-    args = parser.parse_args()
+def provision(email, key_alias=None, key_value=None):
+    """Look up or create the user for email and create an API key.
 
-    email = args.email
-    key_alias = args.alias or email.split("@")[0]
-    key_value = args.key
+    Returns the API key, or None if any step failed.
+    """
+    key_alias = key_alias or email.split("@")[0]
 
     print(f"📧 Processing: {email}", file=sys.stderr)
 
@@ -124,17 +131,89 @@ def main():
         user_id = user.get("user_id")
         print(f"👤 User already exists: {user_id}", file=sys.stderr)
     else:
-        print(f"👤 Creating new user...", file=sys.stderr)
+        print(f"👤 Creating new user {email}...", file=sys.stderr)
         result = create_user(email)
+        if result is None:
+            return None
         user_id = result.get("user_id")
         print(f"✅ User created: {user_id}", file=sys.stderr)
 
     # Create API key
-    print(f"🔑 Creating API key...", file=sys.stderr)
+    print(f"🔑 Creating API key {key_alias}...", file=sys.stderr)
     key_result = create_api_key(user_id, key_alias, key_value)
-    api_key = key_result.get("key")
+    if key_result is None:
+        return None
+
+    print(f"✅ API key created for {email}", file=sys.stderr)
+    return key_result.get("key")
+
+
+def read_emails_file(path):
+    """Read one email per line, skipping blank lines and # comments."""
+    with open(path) as f:
+        return [
+            line.strip()
+            for line in f
+            if line.strip() and not line.strip().startswith("#")
+        ]
 
-    print(f"✅ API key created", file=sys.stderr)
+
+def provision_batch(emails):
+    """Provision users concurrently and print email<TAB>api_key per user.
+
+    Returns True if every user was provisioned.
+    """
+    # Provisioning the same email concurrently could create the user twice
+    unique_emails = list(dict.fromkeys(emails))
+    if len(unique_emails) < len(emails):
+        duplicates = [email for email, n in Counter(emails).items() if n > 1]
+        print(f"⚠️ Ignoring duplicate emails: {duplicates}", file=sys.stderr)
+        emails = unique_emails
+
+    with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+        api_keys = list(executor.map(provision, emails))
+
+    for email, api_key in zip(emails, api_keys):
+        if api_key:
+            print(f"{email}\t{api_key}")
+
+    failed = [email for email, api_key in zip(emails, api_keys) if not api_key]
+    if failed:
+        print(
+            f"❌ Failed to provision {len(failed)} user(s): {failed}",
+            file=sys.stderr,
+        )
+    return not failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Create LiteLLM user and API key")
+    parser.add_argument("email", nargs="?", help="User email address")
+    parser.add_argument("--alias", "-a", help="API key alias (default: email prefix)")
+    parser.add_argument("--key", "-k", help="Custom API key value (optional)")
+    parser.add_argument(
+        "--emails-file",
+        "-f",
+        help="File with one email per line; provisions all users concurrently "
+        "and prints email<TAB>api_key per line",
+    )
+    args = parser.parse_args()
+
+    if args.emails_file:
+        if args.email or args.alias or args.key:
+            parser.error(
+                "--emails-file cannot be combined with email, --alias or --key"
+            )
+        if not provision_batch(read_emails_file(args.emails_file)):
+            sys.exit(1)
+        return
+
+    if not args.email:
+        parser.error("email is required unless --emails-file is given")
+
+    api_key = provision(args.email, args.alias, args.key)
+    if api_key is None:
+        sys.exit(1)
     print(api_key)
 
 
@@ -11,13 +11,18 @@ Usage:
     python3 gen_config.py --config config.json --output config.gen.json
 """
 
+import functools
+import graphlib
 import json
 import logging
 import urllib.error
 import argparse
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from http_utils import format_http_error, request_json
+from cache_utils import cache_key, read_cache, write_cache
+from http_utils import format_http_error, json_loads, request_json
+from litellm_prices import prefetch_priced_models
 
 logging.basicConfig(
     level=logging.INFO,
@@ -28,6 +33,14 @@ logger = logging.getLogger(__name__)
 DEFAULT_CONFIG_FILE = "config.json"
 DEFAULT_OUTPUT_FILE = "config.gen.json"
 
+# Maximum concurrent /models discovery requests across providers and interfaces
+MODELS_FETCH_MAX_WORKERS = 8
+# Seconds a discovered /models list is reused, e.g. by gen_config.py then config.py
+MODELS_CACHE_TTL = 30
+# Seconds a generated config is reused while its input files are unchanged;
+# bounded because autofilled models still come from provider APIs
+GENERATED_CONFIG_CACHE_TTL = 300
+
 PROVIDER_CONFIG = {
     "openai": {
         "path_suffix": "/v1",
@@ -50,21 +63,33 @@ PROVIDER_CONFIG = {
 
 
 def load_json(file_path):
-    with open(file_path) as f:
-        return json.load(f)
+    return json_loads(Path(file_path).read_bytes())
 
 
 def deep_merge(base: dict, override: dict) -> dict:
-    """Deep merge two dictionaries. Override values take precedence."""
+    """Deep merge two dictionaries. Override values take precedence.
+
+    Only dicts along merged paths are copied; neither input is modified.
+    """
     result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    stack = [(result, override)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                target[key] = value
     return result
 
 
+def get_local_config_path(config_path: Path) -> Path:
+    """Return the local override path (same directory, with .local suffix)."""
+    return config_path.parent / config_path.name.replace(".json", ".local.json")
+
+
 def load_config_with_local(config_path: Path) -> tuple[dict, dict]:
     """Load config.json and merge with config.local.json if it exists.
 
@@ -76,10 +101,7 @@ def load_config_with_local(config_path: Path) -> tuple[dict, dict]:
     config = load_json(config_path)
     base_config = config
 
-    # Determine the local config path (same directory, with .local suffix)
-    local_config_path = config_path.parent / config_path.name.replace(
-        ".json", ".local.json"
-    )
+    local_config_path = get_local_config_path(config_path)
 
     if local_config_path.exists():
         logger.info(f"Found local config: {local_config_path}")
@@ -140,26 +162,56 @@ def resolve_provider_extensions(providers: dict) -> dict:
     This will copy all config from provider-1 and override with provider-2's values.
     Set "$extend": null in config.local.json to remove inheritance.
     """
-    resolved = {}
-
-    # First pass: add providers without $extend
-    for name, config in providers.items():
-        if not config.get("$extend"):
-            resolved[name] = {k: v for k, v in config.items() if k != "$extend"}
-
-    # Second pass: resolve providers with $extend
-    for name, config in providers.items():
-        if config.get("$extend"):
-            base_name = config["$extend"]
-            if base_name not in resolved:
-                logger.error(
-                    f"Provider '{name}' extends non-existent provider '{base_name}'"
-                )
+    # Order providers so each one comes after the provider it extends,
+    # dropping any that take part in an $extend cycle
+    in_cycle = set()
+    while True:
+        sorter = graphlib.TopologicalSorter()
+        for name, config in providers.items():
+            if name in in_cycle:
                 continue
-            base_config = resolved[base_name]
-            merged = deep_merge(base_config, config)
-            resolved[name] = {k: v for k, v in merged.items() if k != "$extend"}
+            base_name = config.get("$extend")
+            if base_name and base_name not in in_cycle:
+                sorter.add(name, base_name)
+            else:
+                sorter.add(name)
+        try:
+            order = list(sorter.static_order())
+            break
+        except graphlib.CycleError as e:
+            cycle = e.args[1]
+            logger.error(f"Circular $extend between providers: {' -> '.join(cycle)}")
+            in_cycle.update(cycle)
+
+    merged_by_name = {}
+    for name in order:
+        if name not in providers:
+            continue
+        config = providers[name]
+        base_name = config.get("$extend")
+        if not base_name:
+            merged = dict(config)
+        elif base_name not in providers:
+            logger.error(
+                f"Provider '{name}' extends non-existent provider '{base_name}'"
+            )
+            continue
+        elif base_name not in merged_by_name:
+            logger.error(
+                f"Provider '{name}' extends unresolved provider '{base_name}'"
+            )
+            continue
+        else:
+            merged = deep_merge(merged_by_name[base_name], config)
+        merged.pop("$extend", None)
+        merged_by_name[name] = merged
 
+    # Keep the previous ordering: plain providers first, then extending ones
+    resolved = {}
+    for extending in (False, True):
+        for name, config in providers.items():
+            if bool(config.get("$extend")) == extending and name in merged_by_name:
+                resolved[name] = merged_by_name[name]
     return resolved
 
 
@@ -272,11 +324,29 @@ def _fetch_gemini_models(api_base: str, api_key: str) -> list[str]:
 def fetch_models_from_api(api_base: str, api_key: str, provider: str) -> list[str]:
     """Fetch available model IDs from a provider's /models endpoint.
 
-    Tries the provider-specific endpoint first, then falls back to
-    OpenAI-compatible /v1/models for anthropic and gemini interfaces.
+    Non-empty results are cached on disk for MODELS_CACHE_TTL seconds so that
+    back-to-back runs do not repeat the discovery requests.
 
     Returns a list of model ID strings.
     """
+    cache_name = f"models-{cache_key(provider, api_base, api_key)}"
+    model_ids = read_cache(cache_name, max_age=MODELS_CACHE_TTL)
+    if model_ids is not None:
+        logger.info(f"Using cached models for {api_base} ({provider})")
+        return model_ids
+
+    model_ids = _fetch_models_from_api(api_base, api_key, provider)
+    if model_ids:
+        write_cache(cache_name, model_ids)
+    return model_ids
+
+
+def _fetch_models_from_api(api_base: str, api_key: str, provider: str) -> list[str]:
+    """Fetch model IDs without caching.
+
+    Tries the provider-specific endpoint first, then falls back to
+    OpenAI-compatible /v1/models for anthropic and gemini interfaces.
+    """
     if provider == "openai":
         return _fetch_openai_models(api_base, api_key)
 
@@ -338,17 +408,25 @@ def _fetch_anthropic_models(api_base: str, api_key: str) -> list[str]:
     return model_ids
 
 
-def natural_sort_key(value: str):
-    parts = re.split(r"(\d+(?:[.-]\d+)*)", value)
+_VERSION_PATTERN = re.compile(r"\d+(?:[.-]\d+)*")
+_VERSION_SPLIT_PATTERN = re.compile(r"(\d+(?:[.-]\d+)*)")
+_VERSION_SEPARATOR_PATTERN = re.compile(r"[.-]")
+
+
+@functools.lru_cache(maxsize=None)
+def natural_sort_key(value: str) -> tuple:
+    # Cached because every payload of a credential shares the same name
     key = []
-    for part in parts:
+    for part in _VERSION_SPLIT_PATTERN.split(value):
         if not part:
             continue
-        if re.fullmatch(r"\d+(?:[.-]\d+)*", part):
-            key.append((0, tuple(int(token) for token in re.split(r"[.-]", part))))
+        if _VERSION_PATTERN.fullmatch(part):
+            key.append(
+                (0, tuple(int(token) for token in _VERSION_SEPARATOR_PATTERN.split(part)))
+            )
         else:
             key.append((1, part))
-    return key
+    return tuple(key)
 
 
 def sort_model_payloads(model_payloads: list[dict]) -> list[dict]:
@@ -362,7 +440,59 @@ def sort_model_payloads(model_payloads: list[dict]) -> list[dict]:
     )
 
 
-def resolve_provider_models(providers: dict, base_model_map: dict = None) -> tuple[list, list]:
+def _get_autofill_models_api_base(provider_config: dict, iface: dict) -> str:
+    """Return the /models API base to autofill from, or "" if autofill is disabled."""
+    # Interface-level setting overrides provider-level default
+    autofill_disabled = iface.get(
+        "models_autofill_disabled",
+        provider_config.get("models_autofill_disabled", False),
+    )
+    if autofill_disabled:
+        return ""
+    return _get_interface_models_api_base(provider_config, iface)
+
+
+def prefetch_provider_models(providers: dict) -> dict:
+    """Fetch /models for every autofill-enabled interface concurrently.
+
+    Each fetch is an independent network round trip (plus pagination for
+    Anthropic), so they are dispatched on a bounded thread pool instead of
+    one after another.
+
+    Returns a dict of (service_name, provider) -> fetched model IDs.
+    """
+    targets = []
+    for service_name, provider_config in providers.items():
+        api_key = provider_config.get("api_key")
+        if not api_key:
+            continue
+        for provider, iface_config in provider_config.get("interfaces", {}).items():
+            iface = iface_config if iface_config else {}
+            models_api_base = _get_autofill_models_api_base(provider_config, iface)
+            if models_api_base:
+                logger.info(
+                    f"Autofilling {service_name}/{provider}, fetching from API..."
+                )
+                targets.append((service_name, provider, models_api_base, api_key))
+
+    if not targets:
+        return {}
+
+    with ThreadPoolExecutor(
+        max_workers=min(MODELS_FETCH_MAX_WORKERS, len(targets))
+    ) as executor:
+        futures = {
+            (service_name, provider): executor.submit(
+                fetch_models_from_api, models_api_base, api_key, provider
+            )
+            for service_name, provider, models_api_base, api_key in targets
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+
+def resolve_provider_models(
+    providers: dict, base_model_map: dict = None, fetched_models_by_iface: dict = None
+) -> tuple[list, list]:
     """Resolve providers into model payloads and derived public model hub entries.
 
     For each provider, for each interface, for each model:
@@ -376,12 +506,16 @@ def resolve_provider_models(providers: dict, base_model_map: dict = None) -> tup
     Args:
         providers: Resolved provider configurations
         base_model_map: Global model_name -> base_model mapping (fallback)
+        fetched_models_by_iface: Result of prefetch_provider_models; fetched
+            here when not given
 
     Returns a tuple of (model payloads, derived public model hub entries).
     """
     models = []
     public_model_hub = []
     base_model_map = base_model_map or {}
+    if fetched_models_by_iface is None:
+        fetched_models_by_iface = prefetch_provider_models(providers)
 
     for service_name, provider_config in providers.items():
         provider_access_groups = provider_config.get("access_groups")
@@ -394,24 +528,17 @@ def resolve_provider_models(providers: dict, base_model_map: dict = None) -> tup
         interfaces = provider_config.get("interfaces", {})
 
         provider_default_models = provider_config.get("models", {})
-        provider_autofill_disabled = provider_config.get("models_autofill_disabled", False)
 
         for provider, iface_config in interfaces.items():
             iface = iface_config if iface_config else {}
             # Merge provider-level default models with interface-level models;
             # interface-level definitions take precedence
             iface_models = {**provider_default_models, **iface.get("models", {})}
-            # Interface-level setting overrides provider-level default
-            autofill_disabled = iface.get("models_autofill_disabled", provider_autofill_disabled)
             model_name_prefix = iface.get("model_name_prefix") if iface.get("model_name_prefix") is not None else f"{provider}/"
-            models_api_base = _get_interface_models_api_base(provider_config, iface)
 
-            # Auto-discover models from API unless autofill is disabled
-            if not autofill_disabled and models_api_base:
-                logger.info(
-                    f"Autofilling {service_name}/{provider}, fetching from API..."
-                )
-                fetched_ids = fetch_models_from_api(models_api_base, api_key, provider)
+            # Auto-discovered models from API (prefetched unless autofill is disabled)
+            if (service_name, provider) in fetched_models_by_iface:
+                fetched_ids = fetched_models_by_iface[(service_name, provider)]
                 if fetched_ids:
                     # Only add models not already explicitly defined
                     new_ids = [m for m in fetched_ids if m not in iface_models]
@@ -475,6 +602,19 @@ def resolve_provider_models(providers: dict, base_model_map: dict = None) -> tup
                 else:
                     model_name_list = [derived_model_name]
 
+                # Resolve access_groups: model-level > model_info-level > provider-level
+                resolved_access_groups = (
+                    access_groups
+                    if access_groups is not None
+                    else model_info_cfg.get("access_groups", provider_access_groups)
+                )
+                resolved_is_public_model_hub = (
+                    is_public_model_hub
+                    if is_public_model_hub is not None
+                    else provider_is_public_model_hub
+                )
+                litellm_model = f"{provider}/{litellm_model_name}"
+
                 for model_name in model_name_list:
                     # Resolve base_model: explicit > raw-name map lookup > model-name map lookup > raw model name
                     resolved_base_model = (
@@ -484,13 +624,6 @@ def resolve_provider_models(providers: dict, base_model_map: dict = None) -> tup
                         or litellm_model_name
                     )
 
-                    # Resolve access_groups: model-level > model_info-level > provider-level
-                    resolved_access_groups = (
-                        access_groups
-                        if access_groups is not None
-                        else model_info_cfg.get("access_groups", provider_access_groups)
-                    )
-
                     # Build model_info
                     model_info = dict(model_info_cfg)
                     if resolved_base_model:
@@ -498,25 +631,14 @@ def resolve_provider_models(providers: dict, base_model_map: dict = None) -> tup
                     if resolved_access_groups:
                         model_info["access_groups"] = resolved_access_groups
 
-                    resolved_is_public_model_hub = (
-                        is_public_model_hub
-                        if is_public_model_hub is not None
-                        else provider_is_public_model_hub
-                    )
-
-                    # Build litellm_params
-                    litellm_params = dict(litellm_params_cfg)
-                    litellm_params.update(
-                        {
-                            "model": f"{provider}/{litellm_model_name}",
-                            "litellm_credential_name": credential_name,
-                        }
-                    )
-
                     models.append(
                         {
                             "model_name": model_name,
-                            "litellm_params": litellm_params,
+                            "litellm_params": {
+                                **litellm_params_cfg,
+                                "model": litellm_model,
+                                "litellm_credential_name": credential_name,
+                            },
                             "model_info": model_info,
                         }
                     )
@@ -580,7 +702,47 @@ def expand_alias_refs(aliases: dict, models: list) -> dict:
     return expanded
 
 
-def generate_config(config_path: Path) -> dict:
+def _config_fingerprint(config_path: Path) -> list:
+    """(mtime_ns, size) of the config and its local override, None if missing."""
+    fingerprint = []
+    for path in (config_path, get_local_config_path(config_path)):
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            fingerprint.append(None)
+        else:
+            fingerprint.append([stat.st_mtime_ns, stat.st_size])
+    return fingerprint
+
+
+def generate_config(config_path: Path, use_cache: bool = True) -> dict:
+    """Generate the resolved config, reusing a recent result if inputs are unchanged.
+
+    The result is cached on disk for GENERATED_CONFIG_CACHE_TTL seconds, keyed
+    by the config path and the mtime/size of config.json and config.local.json.
+    Pass use_cache=False to always regenerate.
+    """
+    cache_name = f"generated-config-{cache_key(str(config_path.resolve()))}"
+    fingerprint = _config_fingerprint(config_path)
+    if use_cache:
+        cached = read_cache(cache_name, max_age=GENERATED_CONFIG_CACHE_TTL)
+        if cached and cached.get("fingerprint") == fingerprint:
+            logger.info("Using cached generated config (config files unchanged)")
+            # Warnings are not cached; re-check so every run reports them
+            validate_config(cached["config"])
+            return cached["config"]
+
+    config, autofill_complete = _generate_config(config_path)
+    if autofill_complete:
+        write_cache(cache_name, {"fingerprint": fingerprint, "config": config})
+    else:
+        # Like fetch_models_from_api, never cache a result missing discovered
+        # models; the next run retries instead of reusing it silently
+        logger.info("Not caching generated config (model discovery incomplete)")
+    return config
+
+
+def _generate_config(config_path: Path) -> tuple[dict, bool]:
     """Load config, merge local overrides, and resolve into deployment-ready format.
 
     Resolves:
@@ -588,13 +750,17 @@ def generate_config(config_path: Path) -> dict:
     2. Provider $extend directives
     3. Providers into a flat `models` array of LiteLLM request bodies
 
-    Returns dict with:
+    Returns (config, autofill_complete); config is a dict with:
     - models: list of LiteLLM /model/new request bodies
     - credentials: list of LiteLLM /credentials request bodies
     - aliases: model alias mappings
     - fallbacks: fallback rules
     - public_model_hub: derived model groups plus explicit aliases to expose in the public model hub
+
+    The bool is False when an autofill interface discovered no models.
     """
+    prefetch_priced_models()
+
     config, base_config = load_config_with_local(config_path)
 
     providers = resolve_provider_extensions(config.get("providers", {}))
@@ -623,7 +789,11 @@ def generate_config(config_path: Path) -> dict:
 
     # Build flat models array and derive public model hub entries from provider/model defaults
     base_model_map = config.get("model_name_base_model_map", {})
-    models, derived_public_model_hub = resolve_provider_models(providers, base_model_map)
+    fetched_models_by_iface = prefetch_provider_models(providers)
+    autofill_complete = all(fetched_models_by_iface.values())
+    models, derived_public_model_hub = resolve_provider_models(
+        providers, base_model_map, fetched_models_by_iface
+    )
     models = sort_model_payloads(models)
 
     # Resolve $base references in fallbacks
@@ -647,47 +817,55 @@ def generate_config(config_path: Path) -> dict:
         public_model_hub.extend(aliases.keys())
     public_model_hub.extend(config.get("public_model_hub", []))
 
-    # Validate aliases, fallbacks, and public model hub entries against known models
-    model_names = {m["model_name"] for m in models}
-    validate_aliases(aliases, model_names)
-    validate_fallbacks(fallbacks, model_names, aliases)
-    validate_public_model_hub(public_model_hub, model_names, aliases)
-    validate_prices(models)
-
-    return {
+    config = {
         "credentials": credentials,
         "models": models,
         "aliases": aliases,
         "fallbacks": fallbacks,
         "public_model_hub": public_model_hub,
     }
+    validate_config(config)
+    return config, autofill_complete
 
 
 def validate_aliases(aliases: dict, model_names: set):
     """Validate that alias targets point to existing models or other aliases."""
-    valid_targets = model_names | set(aliases.keys())
-    for alias_name, target in aliases.items():
-        if target not in valid_targets:
-            logger.warning(
-                f"⚠️ Alias '{alias_name}' points to non-existent model: {target}"
-            )
+    valid_targets = model_names | aliases.keys()
+    missing = set(aliases.values()) - valid_targets
+    if missing:
+        broken = [
+            f"{alias_name} -> {target}"
+            for alias_name, target in aliases.items()
+            if target in missing
+        ]
+        logger.warning(
+            f"⚠️ {len(broken)} alias(es) point to non-existent models: {broken}"
+        )
 
 
 def validate_fallbacks(fallbacks: list, model_names: set, aliases: dict):
     """Validate that fallback sources and targets reference existing models or aliases."""
-    valid_targets = model_names | set(aliases.keys())
-    for fallback_rule in fallbacks:
-        for source, targets in fallback_rule.items():
-            if source not in valid_targets:
-                logger.warning(
-                    f"⚠️ Fallback source '{source}' is not a known model or alias"
-                )
-            for target in targets:
-                if target not in valid_targets:
-                    logger.warning(
-                        f"⚠️ Fallback target '{target}' for '{source}' "
-                        f"is not a known model or alias"
-                    )
+    valid_targets = model_names | aliases.keys()
+    sources = {source for rule in fallbacks for source in rule}
+    targets = {
+        target
+        for rule in fallbacks
+        for rule_targets in rule.values()
+        for target in rule_targets
+    }
+
+    unknown_sources = sorted(sources - valid_targets)
+    if unknown_sources:
+        logger.warning(
+            f"⚠️ {len(unknown_sources)} fallback source(s) are not known models "
+            f"or aliases: {unknown_sources}"
+        )
+    unknown_targets = sorted(targets - valid_targets)
+    if unknown_targets:
+        logger.warning(
+            f"⚠️ {len(unknown_targets)} fallback target(s) are not known models "
+            f"or aliases: {unknown_targets}"
+        )
 
 
 def validate_public_model_hub(public_model_hub: list, model_names: set, aliases: dict):
@@ -695,66 +873,45 @@ def validate_public_model_hub(public_model_hub: list, model_names: set, aliases:
 
     Removes duplicates in-place.
     """
-    valid_targets = model_names | set(aliases.keys())
-    seen = set()
-    i = 0
-
-    while i < len(public_model_hub):
-        entry = public_model_hub[i]
-        if entry in seen:
-            public_model_hub.pop(i)
-            continue
-        seen.add(entry)
-
-        if entry not in valid_targets:
-            logger.warning(
-                f"⚠️ Public model hub entry '{entry}' is not a known model or alias"
-            )
-        i += 1
-
+    valid_targets = model_names | aliases.keys()
+    # dict.fromkeys keeps first-seen order; avoids O(n) list.pop per duplicate
+    public_model_hub[:] = dict.fromkeys(public_model_hub)
 
-
-_litellm_prices_cache = None
-
-LITELLM_PRICES_URL = "https://raw.githubusercontent.com/BerriAI/litellm/refs/heads/main/model_prices_and_context_window.json"
-
-
-def _get_litellm_prices() -> dict:
-    """Fetch and cache LiteLLM model pricing data from GitHub."""
-    global _litellm_prices_cache
-    if _litellm_prices_cache is not None:
-        return _litellm_prices_cache
-
-    try:
-        _litellm_prices_cache = request_json(LITELLM_PRICES_URL, timeout=30)
-    except urllib.error.HTTPError as e:
+    unknown = [entry for entry in public_model_hub if entry not in valid_targets]
+    if unknown:
         logger.warning(
-            f"Failed to fetch LiteLLM pricing data from {LITELLM_PRICES_URL}: "
-            f"{format_http_error(e)}"
+            f"⚠️ {len(unknown)} public model hub entries are not known models "
+            f"or aliases: {unknown}"
         )
-        _litellm_prices_cache = {}
-    except Exception as e:
-        logger.warning(f"Failed to fetch LiteLLM pricing data: {e}")
-        _litellm_prices_cache = {}
 
-    return _litellm_prices_cache
+
+
+def validate_config(config: dict):
+    """Log warnings for aliases, fallbacks, public model hub entries and prices."""
+    models = config["models"]
+    aliases = config["aliases"]
+    model_names = {m["model_name"] for m in models}
+    validate_aliases(aliases, model_names)
+    validate_fallbacks(config["fallbacks"], model_names, aliases)
+    validate_public_model_hub(config["public_model_hub"], model_names, aliases)
+    validate_prices(models)
 
 
 def validate_prices(models: list):
     """Validate that each model's base_model exists in LiteLLM pricing data."""
-    prices = _get_litellm_prices()
-    if not prices:
+    priced_models = prefetch_priced_models().result()
+    if not priced_models:
         logger.warning("⚠️ Skipping price validation (no pricing data available)")
         return
 
-    missing = []
-    for model in models:
-        base_model = model.get("model_info", {}).get("base_model", "")
-        if base_model and base_model not in prices:
-            missing.append(base_model)
+    # Many payloads share a base_model; check each unique name once
+    base_models = {model.get("model_info", {}).get("base_model") for model in models}
+    base_models.discard(None)
+    base_models.discard("")
+    missing = base_models - priced_models
 
     if missing:
-        unique_missing = sorted(set(missing))
+        unique_missing = sorted(missing)
         logger.warning(
             f"⚠️ {len(unique_missing)} base_model(s) not found in LiteLLM pricing: "
             f"{unique_missing}"
@@ -782,6 +939,11 @@ def main():
         default=DEFAULT_OUTPUT_FILE,
         help="Path to the output file (default: config.gen.json)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Regenerate even if a recent cached result matches the config files",
+    )
 
     args = parser.parse_args()
 
@@ -790,11 +952,10 @@ def main():
         return
 
     logger.info(f"Generating config from: {args.config}")
-    config = generate_config(args.config)
+    config = generate_config(args.config, use_cache=not args.no_cache)
 
-    with open(args.output, "w") as f:
-        json.dump(config, f, indent=4)
-        f.write("\n")
+    # Serialize once and write once; stdlib json keeps the 4-space indent
+    args.output.write_text(json.dumps(config, indent=4) + "\n", encoding="utf-8")
 
     logger.info(f"Generated config written to: {args.output}")
 
@@ -1,10 +1,46 @@
+import http.client
+import io
 import json
+import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
 
+try:
+    import orjson
+except ImportError:  # optional speedup; falls back to the stdlib json module
+    orjson = None
+
 
 HTTP_USER_AGENT = "LiteLLM-X-Server-Config/1.0"
 
+# Most bytes read from an error response; only a short preview is ever shown
+ERROR_BODY_LIMIT = 4096
+
+# Base delay in seconds between retries of failed keep-alive requests
+RETRY_BACKOFF = 0.2
+
+# Per-thread pool of open connections keyed by (scheme, netloc)
+_keepalive = threading.local()
+# Every pooled connection across threads, so they can be closed together
+_all_connections = []
+_all_connections_lock = threading.Lock()
+
+
+def json_loads(data):
+    """Parse JSON from bytes or str, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, sort_keys=False) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes for a request body."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    return json.dumps(obj, separators=(",", ":"), sort_keys=sort_keys).encode("utf-8")
+
 
 def build_request(url, *, data=None, headers=None, method=None):
     request_headers = {"User-Agent": HTTP_USER_AGENT}
@@ -41,4 +77,109 @@ def request_json(url, *, data=None, headers=None, method=None, timeout=None):
         method=method,
     )
     with urllib.request.urlopen(req, timeout=timeout) as response:
-        return json.loads(response.read().decode("utf-8"))
+        return json_loads(response.read())
+
+
+def _uses_proxy(parsed):
+    proxies = urllib.request.getproxies()
+    return parsed.scheme in proxies and not urllib.request.proxy_bypass(
+        parsed.hostname or ""
+    )
+
+
+def _get_keepalive_connection(parsed, timeout):
+    connections = getattr(_keepalive, "connections", None)
+    if connections is None:
+        connections = _keepalive.connections = {}
+    key = (parsed.scheme, parsed.netloc)
+    conn = connections.get(key)
+    if conn is None:
+        if parsed.scheme == "https":
+            conn = http.client.HTTPSConnection(parsed.netloc, timeout=timeout)
+        else:
+            conn = http.client.HTTPConnection(parsed.netloc, timeout=timeout)
+        connections[key] = conn
+        with _all_connections_lock:
+            _all_connections.append(conn)
+    return conn
+
+
+def close_keepalive_connections():
+    """Close every pooled keep-alive connection opened by any thread."""
+    with _all_connections_lock:
+        for conn in _all_connections:
+            conn.close()
+
+
+def keepalive_request(
+    url, *, data=None, headers=None, method=None, timeout=None, retries=0
+):
+    """Send a request over a reused per-thread connection and return the body.
+
+    Repeated calls to the same host skip the TCP/TLS handshake. Non-2xx
+    responses raise urllib.error.HTTPError, like urllib.request.urlopen.
+    Connection-level failures are retried up to `retries` times with
+    exponential backoff; only pass retries for idempotent requests.
+    Falls back to urlopen when a proxy is configured for the URL.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return _send_keepalive_request(url, data, headers, method, timeout)
+        except urllib.error.HTTPError:
+            raise
+        except (OSError, http.client.HTTPException):
+            if attempt >= retries:
+                raise
+            time.sleep(RETRY_BACKOFF * 2**attempt)
+
+
+def _send_keepalive_request(url, data, headers, method, timeout):
+    parsed = urllib.parse.urlsplit(url)
+    if _uses_proxy(parsed):
+        req = build_request(url, data=data, headers=headers, method=method)
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return response.read()
+
+    path = parsed.path or "/"
+    if parsed.query:
+        path = f"{path}?{parsed.query}"
+    request_headers = {"User-Agent": HTTP_USER_AGENT}
+    if headers:
+        request_headers.update(headers)
+    method = method or ("POST" if data is not None else "GET")
+
+    conn = _get_keepalive_connection(parsed, timeout)
+    reused = conn.sock is not None
+    try:
+        conn.request(method, path, body=data, headers=request_headers)
+        response = conn.getresponse()
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        conn.close()
+        if not reused:
+            raise
+        # The server closed the idle connection; retry once on a fresh one
+        try:
+            conn.request(method, path, body=data, headers=request_headers)
+            response = conn.getresponse()
+        except Exception:
+            conn.close()
+            raise
+    except Exception:
+        conn.close()
+        raise
+
+    try:
+        if 200 <= response.status < 300:
+            return response.read()
+        body = response.read(ERROR_BODY_LIMIT)
+    except Exception:
+        # A half-read response would poison the next request on this thread
+        conn.close()
+        raise
+
+    if not response.isclosed():
+        # Drop the connection instead of draining an oversized error body
+        conn.close()
+    raise urllib.error.HTTPError(
+        url, response.status, response.reason, response.headers, io.BytesIO(body)
+    )
@@ -0,0 +1,83 @@
+"""
+LiteLLM pricing data shared by gen_config.py and config.py.
+
+The pricing JSON is fetched at most once per process and reduced to the set
+of priced model names, which is all base_model validation needs.
+"""
+
+import functools
+import logging
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from cache_utils import read_cache, write_cache
+from http_utils import build_request, format_http_error, json_loads
+
+logger = logging.getLogger(__name__)
+
+LITELLM_PRICES_URL = "https://raw.githubusercontent.com/BerriAI/litellm/refs/heads/main/model_prices_and_context_window.json"
+
+LITELLM_PRICES_CACHE_NAME = "priced_models"
+
+_prefetch_lock = threading.Lock()
+_prefetch_future = None
+
+
+@functools.lru_cache(maxsize=1)
+def get_priced_models() -> frozenset:
+    """Fetch and cache the model names present in LiteLLM's pricing data.
+
+    Only the names are needed for validation, so the multi-MB pricing JSON is
+    reduced to its keys and only that list is kept in memory and on disk.
+    The ETag is stored alongside it so later runs revalidate with
+    If-None-Match and only re-download the file when it has changed.
+    """
+    cached = read_cache(LITELLM_PRICES_CACHE_NAME) or {}
+    cached_etag = cached.get("etag")
+    cached_model_names = cached.get("model_names")
+    headers = {"If-None-Match": cached_etag} if cached_etag else None
+    model_names = None
+
+    try:
+        req = build_request(LITELLM_PRICES_URL, headers=headers)
+        with urllib.request.urlopen(req, timeout=30) as response:
+            prices = json_loads(response.read())
+            etag = response.headers.get("ETag")
+        model_names = sorted(prices)
+        if etag:
+            write_cache(
+                LITELLM_PRICES_CACHE_NAME, {"etag": etag, "model_names": model_names}
+            )
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            model_names = cached_model_names
+        else:
+            logger.warning(
+                f"Failed to fetch LiteLLM pricing data from {LITELLM_PRICES_URL}: "
+                f"{format_http_error(e)}"
+            )
+    except Exception as e:
+        logger.warning(f"Failed to fetch LiteLLM pricing data: {e}")
+
+    if model_names is None and cached_model_names is not None:
+        logger.info("Using cached LiteLLM pricing data")
+        model_names = cached_model_names
+
+    return frozenset(model_names or ())
+
+
+def prefetch_priced_models():
+    """Start fetching LiteLLM pricing data in the background.
+
+    Returns a future resolving to get_priced_models(), so the download can
+    overlap with config loading and model discovery. Repeated calls return
+    the same future.
+    """
+    global _prefetch_future
+    with _prefetch_lock:
+        if _prefetch_future is None:
+            executor = ThreadPoolExecutor(max_workers=1)
+            _prefetch_future = executor.submit(get_priced_models)
+            executor.shutdown(wait=False)
+    return _prefetch_future
@@ -4,19 +4,24 @@ def load_dotenv(file_path=".env"):
     if not os.path.exists(file_path):
         return
 
-    with open(file_path, "r") as f:
+    values = {}
+    with open(file_path, "r", encoding="utf-8") as f:
         for line in f:
             # Clean up whitespace and skip empty lines or comments
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
-            
+
             # Split by the first '=' found
-            if "=" in line:
-                key, value = line.split("=", 1)
-                
-                # Remove optional quotes around values
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                
-                os.environ[key] = value
+            key, sep, value = line.partition("=")
+            if not sep:
+                continue
+
+            # Remove one matching pair of optional quotes around values
+            value = value.strip()
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+                value = value[1:-1]
+
+            values[key.strip()] = value
+
+    os.environ.update(values)